@@ -1,56 +1,75 @@
-from enum import Enum
+import re
+import sys
+from enum import IntEnum, Enum, auto
 from dataclasses import dataclass
 from typing import Optional
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    # IntEnum so token-type comparisons are C-level int compares instead
+    # of Enum.__eq__ dispatch; the members stay usable as singletons for
+    # 'is' checks.
+
     # Keywords
-    FUNC = "func"
-    INT = "int"
-    VOID = "void"
-    LET = "let"
-    IF = "if"
-    ELSE = "else"
-    FOR = "for"
-    RETURN = "return"
-    BREAK = "break"
-    CONTINUE = "continue"
+    FUNC = auto()
+    INT = auto()
+    VOID = auto()
+    LET = auto()
+    IF = auto()
+    ELSE = auto()
+    FOR = auto()
+    RETURN = auto()
+    BREAK = auto()
+    CONTINUE = auto()
 
     # Identifiers and literals
-    IDENTIFIER = "identifier"
-    INTEGER = "integer"
+    IDENTIFIER = auto()
+    INTEGER = auto()
 
     # Operators
-    PLUS = "+"
-    MINUS = "-"
-    MULTIPLY = "*"
-    DIVIDE = "/"
-    MODULO = "%"
-    EQUAL = "=="
-    NOT_EQUAL = "!="
-    LESS = "<"
-    LESS_EQUAL = "<="
-    GREATER = ">"
-    GREATER_EQUAL = ">="
-    AND = "&&"
-    OR = "||"
-    NOT = "!"
-    ASSIGN = "="
-    ARROW = "->"
+    PLUS = auto()
+    MINUS = auto()
+    MULTIPLY = auto()
+    DIVIDE = auto()
+    MODULO = auto()
+    EQUAL = auto()
+    NOT_EQUAL = auto()
+    LESS = auto()
+    LESS_EQUAL = auto()
+    GREATER = auto()
+    GREATER_EQUAL = auto()
+    AND = auto()
+    OR = auto()
+    NOT = auto()
+    ASSIGN = auto()
+    ARROW = auto()
 
     # Punctuation
-    LPAREN = "("
-    RPAREN = ")"
-    LBRACE = "{"
-    RBRACE = "}"
-    LBRACKET = "["
-    RBRACKET = "]"
-    SEMICOLON = ";"
-    COMMA = ","
+    LPAREN = auto()
+    RPAREN = auto()
+    LBRACE = auto()
+    RBRACE = auto()
+    LBRACKET = auto()
+    RBRACKET = auto()
+    SEMICOLON = auto()
+    COMMA = auto()
 
     # Special
-    EOF = "EOF"
-    ERROR = "ERROR"
+    EOF = auto()
+    ERROR = auto()
+
+
+class IdentifierKind(Enum):
+    """What construct an IDENTIFIER token starts, precomputed by the lexer.
+
+    The parser dispatches statements on this tag instead of re-scanning
+    the token stream for a matching ``] =`` on every array assignment.
+    """
+
+    CALL = auto()  # identifier followed by '('
+    REASSIGN = auto()  # identifier followed by '='
+    INDEX_ASSIGN = auto()  # identifier '[' ... ']' ... '=' (array element)
+    PLAIN = auto()  # anything else (plain expression use)
 
 
 @dataclass
@@ -59,17 +78,73 @@ class Token:
     value: str
     line: int
     column: int
+    kind: Optional[IdentifierKind] = None
 
     def __repr__(self):
         return f"Token({self.type.name}, {self.value!r}, line={self.line}, col={self.column})"
 
 
+# One pre-compiled alternation for the whole token grammar: tokenize()
+# is a single finditer() loop driven by the regex engine's C matcher
+# instead of a char-by-char Python loop.  Order matters — multi-char
+# operators must come before their single-char prefixes, and the final
+# catch-all picks up characters the grammar does not know.
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<SKIP>[ \t\r\n]+|//[^\n]*)
+    | (?P<INTEGER>\d+)
+    | (?P<IDENTIFIER>[A-Za-z_]\w*)
+    | (?P<ARROW>->)
+    | (?P<EQUAL>==) | (?P<NOT_EQUAL>!=)
+    | (?P<LESS_EQUAL><=) | (?P<GREATER_EQUAL>>=)
+    | (?P<AND>&&) | (?P<OR>\|\|)
+    | (?P<PLUS>\+) | (?P<MINUS>-) | (?P<MULTIPLY>\*)
+    | (?P<DIVIDE>/) | (?P<MODULO>%)
+    | (?P<NOT>!) | (?P<ASSIGN>=) | (?P<LESS><) | (?P<GREATER>>)
+    | (?P<LPAREN>\() | (?P<RPAREN>\))
+    | (?P<LBRACE>\{) | (?P<RBRACE>\})
+    | (?P<LBRACKET>\[) | (?P<RBRACKET>\])
+    | (?P<SEMICOLON>;) | (?P<COMMA>,)
+    | (?P<MISMATCH>.)
+    """,
+    re.VERBOSE,
+)
+
+# Operator and punctuation groups each match exactly one spelling, so
+# tokenize() takes the value from this table instead of slicing a fresh
+# string out of the match: every '==' token (and the BinaryOp.operator
+# built from it) shares one constant.
+_GROUP_TO_TOKEN: dict[str, tuple[TokenType, str]] = {
+    "ARROW": (TokenType.ARROW, "->"),
+    "EQUAL": (TokenType.EQUAL, "=="),
+    "NOT_EQUAL": (TokenType.NOT_EQUAL, "!="),
+    "LESS_EQUAL": (TokenType.LESS_EQUAL, "<="),
+    "GREATER_EQUAL": (TokenType.GREATER_EQUAL, ">="),
+    "AND": (TokenType.AND, "&&"),
+    "OR": (TokenType.OR, "||"),
+    "PLUS": (TokenType.PLUS, "+"),
+    "MINUS": (TokenType.MINUS, "-"),
+    "MULTIPLY": (TokenType.MULTIPLY, "*"),
+    "DIVIDE": (TokenType.DIVIDE, "/"),
+    "MODULO": (TokenType.MODULO, "%"),
+    "NOT": (TokenType.NOT, "!"),
+    "ASSIGN": (TokenType.ASSIGN, "="),
+    "LESS": (TokenType.LESS, "<"),
+    "GREATER": (TokenType.GREATER, ">"),
+    "LPAREN": (TokenType.LPAREN, "("),
+    "RPAREN": (TokenType.RPAREN, ")"),
+    "LBRACE": (TokenType.LBRACE, "{"),
+    "RBRACE": (TokenType.RBRACE, "}"),
+    "LBRACKET": (TokenType.LBRACKET, "["),
+    "RBRACKET": (TokenType.RBRACKET, "]"),
+    "SEMICOLON": (TokenType.SEMICOLON, ";"),
+    "COMMA": (TokenType.COMMA, ","),
+}
+
+
 class Lexer:
     def __init__(self, source: str):
         self.source = source
-        self.pos = 0
-        self.line = 1
-        self.column = 1
         self.keywords = {
             "func": TokenType.FUNC,
             "int": TokenType.INT,
@@ -83,195 +158,94 @@ class Lexer:
             "continue": TokenType.CONTINUE,
         }
 
-    def _current_char(self) -> Optional[str]:
-        if self.pos >= len(self.source):
-            return None
-        return self.source[self.pos]
-
-    def _peek_char(self, offset: int = 1) -> Optional[str]:
-        peek_pos = self.pos + offset
-        if peek_pos >= len(self.source):
-            return None
-        return self.source[peek_pos]
-
-    def _advance(self) -> Optional[str]:
-        if self.pos >= len(self.source):
-            return None
-
-        char = self.source[self.pos]
-        self.pos += 1
-
-        if char == "\n":
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-
-        return char
-
-    def _skip_whitespace(self):
-        char = self._current_char()
-        while char and char in " \t\r\n":
-            self._advance()
-            char = self._current_char()
-
-    def _skip_comment(self):
-        if self._current_char() == "/" and self._peek_char() == "/":
-            # Skip both slashes
-            self._advance()
-            self._advance()
-            # Skip until newline or EOF (support both \n and \r\n)
-            while True:
-                char = self._current_char()
-                if char is None:
-                    break
-                if char == "\n":
-                    self._advance()
-                    break
-                if char == "\r":
-                    self._advance()
-                    if self._current_char() == "\n":
-                        self._advance()
-                    break
-                self._advance()
-
-    def _read_integer(self) -> str:
-        start_pos = self.pos
-        char = self._current_char()
-        while char and char.isdigit():
-            self._advance()
-            char = self._current_char()
-        return self.source[start_pos : self.pos]
-
-    def _read_identifier(self) -> str:
-        start_pos = self.pos
-        char = self._current_char()
-        while char and (char.isalnum() or char == "_"):
-            self._advance()
-            char = self._current_char()
-        return self.source[start_pos : self.pos]
-
-    def _next_token(self) -> Token:
-        # Skip whitespace and comments
-        while True:
-            self._skip_whitespace()
-            if self._current_char() == "/" and self._peek_char() == "/":
-                self._skip_comment()
-            else:
-                break
-
-        # Check for EOF
-        if self._current_char() is None:
-            return Token(TokenType.EOF, "", self.line, self.column)
-
-        line = self.line
-        column = self.column
-
-        char = self._current_char()
-
-        if char == "(":
-            self._advance()
-            return Token(TokenType.LPAREN, "(", line, column)
-        elif char == ")":
-            self._advance()
-            return Token(TokenType.RPAREN, ")", line, column)
-        elif char == "{":
-            self._advance()
-            return Token(TokenType.LBRACE, "{", line, column)
-        elif char == "}":
-            self._advance()
-            return Token(TokenType.RBRACE, "}", line, column)
-        elif char == "[":
-            self._advance()
-            return Token(TokenType.LBRACKET, "[", line, column)
-        elif char == "]":
-            self._advance()
-            return Token(TokenType.RBRACKET, "]", line, column)
-        elif char == ";":
-            self._advance()
-            return Token(TokenType.SEMICOLON, ";", line, column)
-        elif char == ",":
-            self._advance()
-            return Token(TokenType.COMMA, ",", line, column)
-        elif char == "+":
-            self._advance()
-            return Token(TokenType.PLUS, "+", line, column)
-        elif char == "*":
-            self._advance()
-            return Token(TokenType.MULTIPLY, "*", line, column)
-        elif char == "/":
-            self._advance()
-            return Token(TokenType.DIVIDE, "/", line, column)
-        elif char == "%":
-            self._advance()
-            return Token(TokenType.MODULO, "%", line, column)
-        elif char == "!":
-            self._advance()
-            if self._current_char() == "=":
-                self._advance()
-                return Token(TokenType.NOT_EQUAL, "!=", line, column)
-            return Token(TokenType.NOT, "!", line, column)
-
-        elif char == "=":
-            self._advance()
-            if self._current_char() == "=":
-                self._advance()
-                return Token(TokenType.EQUAL, "==", line, column)
-            return Token(TokenType.ASSIGN, "=", line, column)
-        elif char == "<":
-            self._advance()
-            if self._current_char() == "=":
-                self._advance()
-                return Token(TokenType.LESS_EQUAL, "<=", line, column)
-            return Token(TokenType.LESS, "<", line, column)
-        elif char == ">":
-            self._advance()
-            if self._current_char() == "=":
-                self._advance()
-                return Token(TokenType.GREATER_EQUAL, ">=", line, column)
-            return Token(TokenType.GREATER, ">", line, column)
-        elif char == "&":
-            self._advance()
-            if self._current_char() == "&":
-                self._advance()
-                return Token(TokenType.AND, "&&", line, column)
-            return Token(TokenType.ERROR, f"Unexpected character: &", line, column)
-        elif char == "|":
-            self._advance()
-            if self._current_char() == "|":
-                self._advance()
-                return Token(TokenType.OR, "||", line, column)
-            return Token(TokenType.ERROR, f"Unexpected character: |", line, column)
-        elif char == "-":
-            self._advance()
-            if self._current_char() == ">":
-                self._advance()
-                return Token(TokenType.ARROW, "->", line, column)
-            return Token(TokenType.MINUS, "-", line, column)
-
-        elif char and char.isdigit():
-            value = self._read_integer()
-            return Token(TokenType.INTEGER, value, line, column)
-
-        elif char and (char.isalpha() or char == "_"):
-            value = self._read_identifier()
-            token_type = self.keywords.get(value, TokenType.IDENTIFIER)
-            return Token(token_type, value, line, column)
-
-        else:
-            self._advance()
-            return Token(TokenType.ERROR, f"Unexpected character: {char}", line, column)
-
     def tokenize(self) -> list[Token]:
         """Tokenize the entire source code."""
         tokens = []
-        while True:
-            token = self._next_token()
-            tokens.append(token)
-            if token.type == TokenType.EOF:
-                break
+        append = tokens.append
+        keywords = self.keywords
+        identifier = TokenType.IDENTIFIER
+        integer = TokenType.INTEGER
+        error = TokenType.ERROR
+        line = 1
+        line_start = 0
+        for m in _TOKEN_RE.finditer(self.source):
+            group = m.lastgroup
+            text = m.group()
+            if group == "SKIP":
+                newlines = text.count("\n")
+                if newlines:
+                    line += newlines
+                    line_start = m.start() + text.rfind("\n") + 1
+                continue
+            column = m.start() - line_start + 1
+            if group == "IDENTIFIER":
+                # Intern identifiers so repeated names share one string
+                # object: the AST stores many copies of the same few names,
+                # and interned strings make later dict lookups a pointer
+                # compare.
+                value = sys.intern(text)
+                append(Token(keywords.get(value, identifier), value, line, column))
+            elif group == "INTEGER":
+                append(Token(integer, text, line, column))
+            elif group == "MISMATCH":
+                append(Token(error, f"Unexpected character: {text}", line, column))
+            else:
+                tok_type, value = _GROUP_TO_TOKEN[group]
+                append(Token(tok_type, value, line, column))
+        append(Token(TokenType.EOF, "", line, len(self.source) - line_start + 1))
+        self._classify_identifiers(tokens)
         return tokens
 
+    @staticmethod
+    def _classify_identifiers(tokens: list[Token]) -> None:
+        """Tag every IDENTIFIER token with its IdentifierKind.
+
+        Two linear passes: match brackets with a stack, then follow each
+        identifier's (possibly chained) index brackets to see whether an
+        '=' comes next.  Unmatched brackets simply leave the identifier
+        PLAIN; the parser reports the error when it gets there.
+        """
+        # Pack the token types into a bytes buffer: both scans then read
+        # one byte per token instead of dereferencing a Token object and
+        # its type attribute.  TokenType values all fit in a byte.
+        types = bytes(token.type for token in tokens)
+        lbracket = TokenType.LBRACKET
+        rbracket = TokenType.RBRACKET
+
+        matching: dict[int, int] = {}
+        stack: list[int] = []
+        for i, t in enumerate(types):
+            if t == lbracket:
+                stack.append(i)
+            elif t == rbracket and stack:
+                matching[stack.pop()] = i
+
+        identifier = TokenType.IDENTIFIER
+        lparen = TokenType.LPAREN
+        assign = TokenType.ASSIGN
+        for i, t in enumerate(types):
+            if t != identifier:
+                continue
+            token = tokens[i]
+            next_type = types[i + 1]
+            if next_type == lparen:
+                token.kind = IdentifierKind.CALL
+            elif next_type == assign:
+                token.kind = IdentifierKind.REASSIGN
+            elif next_type == lbracket:
+                j = i + 1
+                while types[j] == lbracket:
+                    end = matching.get(j)
+                    if end is None:
+                        break
+                    j = end + 1
+                if types[j] == assign:
+                    token.kind = IdentifierKind.INDEX_ASSIGN
+                else:
+                    token.kind = IdentifierKind.PLAIN
+            else:
+                token.kind = IdentifierKind.PLAIN
+
 
 if __name__ == "__main__":
     test_code = """func main() -> void {
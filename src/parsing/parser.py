@@ -1,21 +1,22 @@
 from abc import ABC
+from array import array
 from dataclasses import dataclass, field
-from typing import Optional, List, Union, TYPE_CHECKING
+from typing import Optional, List, Sequence, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .semantic import SymbolTable
 
-from .lexer import Lexer, Token, TokenType
+from .lexer import IdentifierKind, Lexer, Token, TokenType
 
 
 # AST Node classes
-@dataclass
+@dataclass(slots=True)
 class ASTNode(ABC):
     line: int
     column: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Program(ASTNode):
     line: int = field(init=False, default=1)
     column: int = field(init=False, default=1)
@@ -24,46 +25,46 @@ class Program(ASTNode):
     symbol_table: Optional["SymbolTable"] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Function(ASTNode):
     name: str
-    args: List["Argument"]
+    args: Sequence["Argument"]
     return_type: str
     body: "Block"
 
 
-@dataclass
+@dataclass(slots=True)
 class Argument(ASTNode):
     name: str
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Statement(ASTNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment(Statement):
     name: str
     type: str
     value: "Expression"
 
 
-@dataclass
+@dataclass(slots=True)
 class Reassignment(Statement):
     lvalue: "LValue"
     value: "Expression"
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition(Statement):
     condition: "Expression"
     then_block: "Block"
     else_block: Optional["Block"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ForLoop(Statement):
     init: list[Assignment]
     condition: "Expression"
@@ -71,144 +72,282 @@ class ForLoop(Statement):
     body: "Block"
 
 
-@dataclass
+@dataclass(slots=True)
 class UnconditionalLoop(Statement):
     body: "Block"
 
 
-@dataclass
-class FunctionCall(Statement):
-    name: str
-    args: List["Expression"]
-
-
-@dataclass
+@dataclass(slots=True)
 class Return(Statement):
     value: Optional["Expression"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Break(Statement):
     line: int
     column: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Continue(Statement):
     line: int
     column: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     statements: List[Statement]
     symbol_table: Optional["SymbolTable"] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Expression(ASTNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp(Expression):
     operator: str
     left: Expression
     right: Expression
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Expression):
     operator: str
     operand: Expression
 
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(Expression):
     name: str
 
 
-@dataclass
 class IntegerLiteral(Expression):
-    value: int
-
+    """Integer literal that converts its token text on first use.
+
+    The parser stores the raw digit string; int() runs only when some
+    pass actually reads .value, so literals that are never folded or
+    emitted cost no conversion.  Hand-rolled (not a dataclass) to keep
+    the lazy property while preserving the positional __match_args__
+    and equality the rest of the code relies on.
+    """
+
+    __slots__ = ("_raw", "_value")
+    __match_args__ = ("line", "column", "value")
+
+    def __init__(self, line: int, column: int, value: Union[int, str]):
+        self.line = line
+        self.column = column
+        if type(value) is int:
+            self._raw = None
+            self._value = value
+        else:
+            self._raw = value
+            self._value = None
+
+    @property
+    def value(self) -> int:
+        v = self._value
+        if v is None:
+            v = self._value = int(self._raw)
+        return v
+
+    def __eq__(self, other):
+        return (
+            type(other) is IntegerLiteral
+            and self.line == other.line
+            and self.column == other.column
+            and self.value == other.value
+        )
+
+    def __repr__(self):
+        return (
+            f"IntegerLiteral(line={self.line}, column={self.column},"
+            f" value={self.value})"
+        )
+
+
+@dataclass(slots=True)
+class Call(Statement, Expression):
+    """Function call; the grammar context decides whether it is a
+    statement or an expression, so one class serves both roles."""
 
-@dataclass
-class CallExpression(Expression):
     name: str
-    args: List[Expression]
+    args: Sequence[Expression]
+
 
+# Context-specific names kept for the existing consumers and match arms.
+FunctionCall = Call
+CallExpression = Call
 
-@dataclass
+
+@dataclass(slots=True)
 class ArrayAccess(Expression):
     base: Identifier
     indices: List[Expression]
+    # Compact view of `indices` when every index is an integer literal:
+    # an array('q') of the constant values, None otherwise.  Consumers
+    # that only need constant indices can read it without walking the
+    # expression objects.
+    literal_indices: Optional[array] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayInit(Expression):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class LValue(ASTNode):
     """Left-hand side value for assignments - can be identifier or array access."""
 
 
-@dataclass
+@dataclass(slots=True)
 class LValueIdentifier(LValue):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LValueArrayAccess(LValue):
     base: str
     indices: List[Expression]
+    # Same compact all-literal view as ArrayAccess.literal_indices.
+    literal_indices: Optional[array] = None
+
+
+# Hot token types bound at module scope: skips EnumMeta attribute
+# resolution on every comparison, and the members are singletons so 'is'
+# checks are plain pointer compares.
+_IDENTIFIER = TokenType.IDENTIFIER
+_INTEGER = TokenType.INTEGER
+_INT = TokenType.INT
+_VOID = TokenType.VOID
+_PLUS = TokenType.PLUS
+_MINUS = TokenType.MINUS
+_NOT = TokenType.NOT
+_LPAREN = TokenType.LPAREN
+_RPAREN = TokenType.RPAREN
+_LBRACKET = TokenType.LBRACKET
+_RBRACKET = TokenType.RBRACKET
+_LBRACE = TokenType.LBRACE
+_RBRACE = TokenType.RBRACE
+_COMMA = TokenType.COMMA
+_SEMICOLON = TokenType.SEMICOLON
+
+
+# Binding powers for the binary operators, lowest first.  parse_expr climbs
+# this table instead of recursing through one method per precedence level.
+_BIN_PREC: dict[TokenType, int] = {
+    TokenType.OR: 1,
+    TokenType.AND: 2,
+    TokenType.EQUAL: 3,
+    TokenType.NOT_EQUAL: 3,
+    TokenType.LESS: 3,
+    TokenType.LESS_EQUAL: 3,
+    TokenType.GREATER: 3,
+    TokenType.GREATER_EQUAL: 3,
+    TokenType.PLUS: 4,
+    TokenType.MINUS: 4,
+    TokenType.MULTIPLY: 5,
+    TokenType.DIVIDE: 5,
+    TokenType.MODULO: 5,
+}
+
+
+# Shared empty argument sequence: zero-arg calls and argument lists are
+# common enough that allocating a fresh list for each is wasted work.
+_EMPTY_ARGS: tuple = ()
+
+# Array type strings, deduplicated across the whole parse.
+_TYPE_INTERN: dict[str, str] = {}
+
+
+def _literal_index_view(indices: List[Expression]) -> Optional[array]:
+    """Pack indices into an array('q') when all of them are literals."""
+    for index in indices:
+        if type(index) is not IntegerLiteral:
+            return None
+    try:
+        return array("q", [index.value for index in indices])
+    except OverflowError:
+        # A literal outside the signed 64-bit range still parses; it
+        # just keeps the object-index representation.
+        return None
 
 
 class ParseError(Exception):
     def __init__(self, message: str, token: Optional[Token] = None):
+        super().__init__(message, token)
         self.message = message
         self.token = token
-        if token:
-            super().__init__(f"{message} at line {token.line}, column {token.column}")
-        else:
-            super().__init__(message)
+
+    def __str__(self) -> str:
+        # Formatting is deferred to here so raising (e.g. speculative
+        # parses that get caught) never pays for the f-string.
+        if self.token:
+            return (
+                f"{self.message} at line {self.token.line},"
+                f" column {self.token.column}"
+            )
+        return self.message
 
 
 class Parser:
-    def __init__(self, lexer: Lexer):
+    def __init__(self, lexer: Lexer, memoize_expressions: bool = False):
         self.lexer = lexer
-        self.tokens = lexer.tokenize()
-        self.pos = 0
-        self.current_token = self.tokens[0] if self.tokens else None
-
-    def advance(self):
+        self.tokens: List[Token] = lexer.tokenize()
+        # Packrat-style memo of (pos, min_bp) -> (expr, end_pos).  Opt-in:
+        # this grammar backtracks rarely, so the table only pays off on
+        # inputs that re-parse the same expression spans speculatively.
+        self._memo: Optional[dict] = {} if memoize_expressions else None
+        # Token types as a parallel array: hot dispatch reads one list slot
+        # instead of chasing token-object attributes.
+        self._types: List[TokenType] = [token.type for token in self.tokens]
+        self._n: int = len(self.tokens)
+        self.pos: int = 0
+
+    @property
+    def current_token(self) -> Optional[Token]:
+        # Derived from pos rather than stored: advance() used to pay two
+        # extra attribute writes per token keeping a cached copy in sync.
+        pos = self.pos
+        return self.tokens[pos] if pos < self._n else None
+
+    def advance(self) -> None:
         self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
-        else:
-            self.current_token = None
 
     def expect(self, token_type: TokenType) -> Token:
-        if not self.current_token:
+        pos = self.pos
+        if pos >= self._n:
             raise ParseError(f"Expected {token_type.name}, but reached end of file")
 
-        if self.current_token.type != token_type:
+        token = self.tokens[pos]
+        if token.type != token_type:
             raise ParseError(
-                f"Expected {token_type.name}, but got {self.current_token.type.name}",
-                self.current_token,
+                f"Expected {token_type.name}, but got {token.type.name}",
+                token,
             )
 
-        token = self.current_token
-        self.advance()
+        self.pos = pos + 1
         return token
 
+    def _raise_expect(self, token_type: TokenType):
+        """Cold path shared by the inlined expect() sites."""
+        if self.pos >= self._n:
+            raise ParseError(f"Expected {token_type.name}, but reached end of file")
+        token = self.tokens[self.pos]
+        raise ParseError(
+            f"Expected {token_type.name}, but got {token.type.name}", token
+        )
+
     def check(self, token_type: TokenType) -> bool:
-        return self.current_token is not None and self.current_token.type == token_type
+        pos = self.pos
+        return pos < self._n and self._types[pos] == token_type
 
     def match(self, *token_types: TokenType) -> bool:
-        return self.current_token is not None and self.current_token.type in token_types
+        pos = self.pos
+        return pos < self._n and self._types[pos] in token_types
 
     def parse(self) -> Program:
         """
@@ -216,7 +355,7 @@ class Parser:
         """
         functions = []
         functions.append(self.parse_function())
-        while self.current_token and self.current_token.type != TokenType.EOF:
+        while self._types[self.pos] != TokenType.EOF:
             functions.append(self.parse_function())
         return Program(functions)
 
@@ -224,6 +363,10 @@ class Parser:
         """
         FUNCTION ::= "func" IDENTIFIER "(" ARG_LIST ")" "->" TYPE BLOCK
         """
+        if self._memo is not None:
+            # Positions are never revisited across functions; dropping old
+            # entries keeps the memo table small.
+            self._memo.clear()
         self.expect(TokenType.FUNC)
 
         name_token = self.expect(TokenType.IDENTIFIER)
@@ -242,14 +385,14 @@ class Parser:
 
         return Function(line, column, name, args, return_type, body)
 
-    def parse_arg_list(self) -> List[Argument]:
+    def parse_arg_list(self) -> Sequence[Argument]:
         """ARG_LIST ::= EPSILON | ARG ("," ARG)*"""
-        args = []
-        if self.check(TokenType.IDENTIFIER):
+        if not self.check(TokenType.IDENTIFIER):
+            return _EMPTY_ARGS
+        args = [self.parse_arg()]
+        while self.check(TokenType.COMMA):
+            self.advance()  # consume comma
             args.append(self.parse_arg())
-            while self.check(TokenType.COMMA):
-                self.advance()  # consume comma
-                args.append(self.parse_arg())
         return args
 
     def parse_arg(self) -> Argument:
@@ -262,6 +405,16 @@ class Parser:
 
     def parse_type(self) -> str:
         """TYPE ::= int | ("[" INTEGER "]")+ int | void"""
+        # Fast path: a bare "int"/"void" needs no dimension loop, no list
+        # and no formatting — just return the interned literal.
+        t = self._types[self.pos]
+        if t is _INT:
+            self.advance()
+            return "int"
+        if t is _VOID:
+            self.advance()
+            return "void"
+
         dimensions = []
         while self.check(TokenType.LBRACKET):
             self.advance()  # consume '['
@@ -284,84 +437,55 @@ class Parser:
 
         if dimensions:
             dims_str = "".join(f"[{d}]" for d in dimensions)
-            return f"{dims_str}{base_type}"
+            # Intern array type strings so identical types share one
+            # object across the parse and compare by pointer first.
+            s = f"{dims_str}{base_type}"
+            return _TYPE_INTERN.setdefault(s, s)
         else:
             return base_type
 
     def parse_statements(self) -> List[Statement]:
         """STATEMENTS ::= STATEMENT*"""
         statements = []
-        while self.current_token and not self.check(TokenType.RBRACE):
-            statements.append(self.parse_statement())
+        append = statements.append
+        types = self._types
+        n = self._n
+        while self.pos < n and types[self.pos] is not _RBRACE:
+            append(self.parse_statement())
         return statements
 
     def parse_statement(self) -> Statement:
         """STATEMENT ::= ASSIGNMENT ";" | REASSIGNMENT ";" | CONDITION | LOOP | FUNCTION_CALL ";" | RETURN ";" | BLOCK"""
-        if not self.current_token:
+        pos = self.pos
+        if pos >= self._n:
             raise ParseError("Unexpected end of file")
-
-        token = self.current_token
-
-        if self.check(TokenType.IF):
-            return self.parse_condition()
-
-        if self.check(TokenType.FOR):
-            return self.parse_loop()
-
-        if self.check(TokenType.RETURN):
-            return self.parse_return()
-
-        if self.check(TokenType.BREAK):
-            return self.parse_break()
-
-        if self.check(TokenType.CONTINUE):
-            return self.parse_continue()
-
-        if self.check(TokenType.LET):
-            assignment = self.parse_assignment()
-            self.expect(TokenType.SEMICOLON)
-            return assignment
-
-        if self.check(TokenType.IDENTIFIER):
-            if self.pos + 1 < len(self.tokens):
-                next_token = self.tokens[self.pos + 1]
-
-                if next_token.type == TokenType.LPAREN:
-                    call = self.parse_function_call()
-                    self.expect(TokenType.SEMICOLON)
-                    return call
-                elif next_token.type == TokenType.ASSIGN:
-                    reassignment = self.parse_reassignment()
-                    self.expect(TokenType.SEMICOLON)
-                    return reassignment
-                elif next_token.type == TokenType.LBRACKET:
-                    peek_pos = self.pos + 1
-                    bracket_count = 0
-                    found_assign = False
-                    while peek_pos < len(self.tokens):
-                        tok = self.tokens[peek_pos]
-                        if tok.type == TokenType.LBRACKET:
-                            bracket_count += 1
-                        elif tok.type == TokenType.RBRACKET:
-                            bracket_count -= 1
-                        elif tok.type == TokenType.ASSIGN and bracket_count == 0:
-                            found_assign = True
-                            break
-                        elif tok.type in (
-                            TokenType.SEMICOLON,
-                            TokenType.EOF,
-                            TokenType.RBRACE,
-                        ):
-                            break
-                        peek_pos += 1
-
-                    if found_assign:
-                        reassignment = self.parse_reassignment()
-                        self.expect(TokenType.SEMICOLON)
-                        return reassignment
+        token = self.tokens[pos]
+        t = token.type
+
+        handler = _STMT_DISPATCH.get(t)
+        if handler is not None:
+            return handler(self)
+
+        if t is _IDENTIFIER:
+            # The lexer pre-classified what this identifier starts, so no
+            # token-stream lookahead is needed here.
+            kind = token.kind
+            if kind is IdentifierKind.CALL:
+                call = self.parse_function_call()
+                self.expect(TokenType.SEMICOLON)
+                return call
+            if kind is IdentifierKind.REASSIGN or kind is IdentifierKind.INDEX_ASSIGN:
+                reassignment = self.parse_reassignment()
+                self.expect(TokenType.SEMICOLON)
+                return reassignment
 
         raise ParseError(f"Unexpected token: {token.type.name}", token)
 
+    def _parse_assignment_statement(self) -> Assignment:
+        assignment = self.parse_assignment()
+        self.expect(TokenType.SEMICOLON)
+        return assignment
+
     def parse_assignment(self) -> Assignment:
         """ASSIGNMENT ::= "let" IDENTIFIER TYPE "=" EXPR"""
         self.expect(TokenType.LET)
@@ -388,8 +512,8 @@ class Parser:
     def parse_reassignment(self) -> Reassignment:
         """REASSIGNMENT ::= EXPR_LVALUE "=" EXPR"""
         lvalue = self.parse_lvalue()
-        line = lvalue.line if hasattr(lvalue, "line") else 0
-        column = lvalue.column if hasattr(lvalue, "column") else 0
+        line = lvalue.line
+        column = lvalue.column
 
         self.expect(TokenType.ASSIGN)
         value = self.parse_expr()
@@ -397,6 +521,22 @@ class Parser:
 
     def parse_lvalue(self) -> "LValue":
         """EXPR_LVALUE ::= IDENTIFIER ("[" EXPR "]")*"""
+        memo = self._memo
+        if memo is not None:
+            # min_bp is never negative, so -1 keys lvalue entries without
+            # colliding with parse_expr's (pos, min_bp) keys.
+            key = (self.pos, -1)
+            hit = memo.get(key)
+            if hit is not None:
+                lvalue, end_pos = hit
+                self._seek(end_pos)
+                return lvalue
+            lvalue = self._parse_lvalue_uncached()
+            memo[key] = (lvalue, self.pos)
+            return lvalue
+        return self._parse_lvalue_uncached()
+
+    def _parse_lvalue_uncached(self) -> "LValue":
         name_token = self.expect(TokenType.IDENTIFIER)
         base_name = name_token.value
         line = name_token.line
@@ -404,14 +544,16 @@ class Parser:
 
         # Check for array indexing
         indices = []
-        while self.check(TokenType.LBRACKET):
+        types = self._types
+        while types[self.pos] is _LBRACKET:
             self.advance()  # consume '['
-            index_expr = self.parse_expr()
-            indices.append(index_expr)
+            indices.append(self.parse_expr())
             self.expect(TokenType.RBRACKET)  # consume ']'
 
         if indices:
-            return LValueArrayAccess(line, column, base_name, indices)
+            return LValueArrayAccess(
+                line, column, base_name, indices, _literal_index_view(indices)
+            )
         else:
             return LValueIdentifier(line, column, base_name)
 
@@ -421,9 +563,13 @@ class Parser:
         line = if_token.line
         column = if_token.column
 
-        self.expect(TokenType.LPAREN)
+        if self._types[self.pos] is not _LPAREN:
+            self._raise_expect(TokenType.LPAREN)
+        self.pos += 1
         condition = self.parse_expr()
-        self.expect(TokenType.RPAREN)
+        if self._types[self.pos] is not _RPAREN:
+            self._raise_expect(TokenType.RPAREN)
+        self.pos += 1
 
         then_block = self.parse_block()
 
@@ -470,22 +616,25 @@ class Parser:
         line = name_token.line
         column = name_token.column
 
-        self.expect(TokenType.LPAREN)
-        args = self.parse_expr_list()
-        self.expect(TokenType.RPAREN)
+        types = self._types
+        if types[self.pos] is not _LPAREN:
+            self._raise_expect(TokenType.LPAREN)
+        self.pos += 1
+        # Same inlined arg-list loop as the call-expression path.
+        if types[self.pos] is _RPAREN:
+            args = _EMPTY_ARGS
+        else:
+            args = [self.parse_expr()]
+            append = args.append
+            while types[self.pos] is _COMMA:
+                self.pos += 1  # consume comma
+                append(self.parse_expr())
+        if types[self.pos] is not _RPAREN:
+            self._raise_expect(TokenType.RPAREN)
+        self.pos += 1
 
         return FunctionCall(line, column, name, args)
 
-    def parse_expr_list(self) -> List[Expression]:
-        """EXPR_LIST ::= EPSILON | EXPR ("," EXPR)*"""
-        args = []
-        if not self.check(TokenType.RPAREN):
-            args.append(self.parse_expr())
-            while self.check(TokenType.COMMA):
-                self.advance()  # consume comma
-                args.append(self.parse_expr())
-        return args
-
     def parse_return(self) -> Return:
         """RETURN ::= "return" [EXPR]"""
         return_token = self.expect(TokenType.RETURN)
@@ -519,142 +668,162 @@ class Parser:
 
     def parse_block(self) -> Block:
         """BLOCK ::= "{" STATEMENTS "}" """
-        self.expect(TokenType.LBRACE)
+        # expect() inlined on the success path: blocks bound every
+        # statement list, and each delimiter is one type compare.
+        if self._types[self.pos] is not _LBRACE:
+            self._raise_expect(TokenType.LBRACE)
+        self.pos += 1
         statements = self.parse_statements()
-        self.expect(TokenType.RBRACE)
+        if self._types[self.pos] is not _RBRACE:
+            self._raise_expect(TokenType.RBRACE)
+        self.pos += 1
         return Block(statements)
 
     # Expression parsing with operator precedence
-    def parse_expr(self) -> Expression:
-        """EXPR ::= EXPR_OR"""
-        return self.parse_expr_or()
-
-    def parse_expr_or(self) -> Expression:
-        """EXPR_OR ::= EXPR_AND ("||" EXPR_AND)*"""
-        left = self.parse_expr_and()
-        while self.check(TokenType.OR):
-            or_token = self.expect(TokenType.OR)
-            right = self.parse_expr_and()
-            left = BinaryOp(or_token.line, or_token.column, "||", left, right)
-        return left
-
-    def parse_expr_and(self) -> Expression:
-        """EXPR_AND ::= EXPR_COMP ("&&" EXPR_COMP)*"""
-        left = self.parse_expr_comp()
-        while self.check(TokenType.AND):
-            and_token = self.expect(TokenType.AND)
-            right = self.parse_expr_comp()
-            left = BinaryOp(and_token.line, and_token.column, "&&", left, right)
-        return left
+    def parse_expr(self, min_bp: int = 0) -> Expression:
+        """
+        EXPR ::= EXPR_OR
 
-    def parse_expr_comp(self) -> Expression:
-        """EXPR_COMP ::= EXPR_ADD (("==" | "!=" | "<" | "<=" | ">" | ">=") EXPR_ADD)*"""
-        left = self.parse_expr_add()
-        while self.match(
-            TokenType.EQUAL,
-            TokenType.NOT_EQUAL,
-            TokenType.LESS,
-            TokenType.LESS_EQUAL,
-            TokenType.GREATER,
-            TokenType.GREATER_EQUAL,
-        ):
-            if self.current_token is None:
-                break
-            op_token = self.current_token
-            self.advance()
-            right = self.parse_expr_add()
-            op_str = op_token.value
-            left = BinaryOp(op_token.line, op_token.column, op_str, left, right)
-        return left
+        Precedence-climbing (Pratt) loop over _BIN_PREC.  Covers the
+        EXPR_OR/EXPR_AND/EXPR_COMP/EXPR_ADD/EXPR_MUL grammar levels in a
+        single method: one call frame per operator instead of one frame
+        per precedence level per leaf.
+        """
+        memo = self._memo
+        if memo is not None:
+            key = (self.pos, min_bp)
+            hit = memo.get(key)
+            if hit is not None:
+                expr, end_pos = hit
+                self._seek(end_pos)
+                return expr
+            expr = self._parse_expr_climb(min_bp)
+            memo[key] = (expr, self.pos)
+            return expr
+        return self._parse_expr_climb(min_bp)
 
-    def parse_expr_add(self) -> Expression:
-        """EXPR_ADD ::= EXPR_MUL (("+" | "-") EXPR_MUL)*"""
-        left = self.parse_expr_mul()
-        while self.match(TokenType.PLUS, TokenType.MINUS):
-            if self.current_token is None:
-                break
-            op_token = self.current_token
-            self.advance()
-            op_str = op_token.value
-            right = self.parse_expr_mul()
-            left = BinaryOp(op_token.line, op_token.column, op_str, left, right)
-        return left
+    def _seek(self, pos: int) -> None:
+        """Jump to a remembered token position (memo replay)."""
+        self.pos = pos
 
-    def parse_expr_mul(self) -> Expression:
-        """EXPR_MUL ::= EXPR_UNARY (("*" | "/" | "%") EXPR_UNARY)*"""
+    def _parse_expr_climb(self, min_bp: int) -> Expression:
         left = self.parse_expr_unary()
-        while self.match(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
-            if self.current_token is None:
+        tokens = self.tokens
+        types = self._types
+        prec = _BIN_PREC
+        while True:
+            pos = self.pos
+            bp = prec.get(types[pos])
+            if bp is None or bp <= min_bp:
                 break
-            op_token = self.current_token
-            self.advance()
-            op_str = op_token.value
-            right = self.parse_expr_unary()
-            left = BinaryOp(op_token.line, op_token.column, op_str, left, right)
+            op_token = tokens[pos]
+            # Inlined advance(): an operator is never the last token, the
+            # EOF sentinel follows it, so no bounds check is needed.
+            self.pos = pos + 1
+            # bp (not bp - 1) as the new floor keeps same-precedence
+            # operators left-associative.
+            right = self.parse_expr(bp)
+            left = BinaryOp(op_token.line, op_token.column, op_token.value, left, right)
         return left
 
     def parse_expr_unary(self) -> Expression:
         """EXPR_UNARY ::= EXPR_ATOM | "+" EXPR_UNARY | "-" EXPR_UNARY | "!" EXPR_UNARY"""
-        if self.check(TokenType.PLUS):
-            plus_token = self.expect(TokenType.PLUS)
-            operand = self.parse_expr_unary()
-            return UnaryOp(plus_token.line, plus_token.column, "+", operand)
-        elif self.check(TokenType.MINUS):
-            minus_token = self.expect(TokenType.MINUS)
-            operand = self.parse_expr_unary()
-            return UnaryOp(minus_token.line, minus_token.column, "-", operand)
-        if self.check(TokenType.MINUS):
-            minus_token = self.expect(TokenType.MINUS)
-            operand = self.parse_expr_unary()
-            return UnaryOp(minus_token.line, minus_token.column, "-", operand)
-        elif self.check(TokenType.NOT):
-            not_token = self.expect(TokenType.NOT)
-            operand = self.parse_expr_unary()
-            return UnaryOp(not_token.line, not_token.column, "!", operand)
-        else:
-            return self.parse_expr_atom()
+        # Collect the prefix chain iteratively, then wrap back-to-front:
+        # one frame no matter how many operators are stacked, and no
+        # recursion limit on pathological chains.
+        ops = None
+        tokens = self.tokens
+        types = self._types
+        while True:
+            t = types[self.pos]
+            if t is _PLUS:
+                op = "+"
+            elif t is _MINUS:
+                op = "-"
+            elif t is _NOT:
+                op = "!"
+            else:
+                break
+            token = tokens[self.pos]
+            self.pos += 1
+            if ops is None:
+                ops = []
+            ops.append((token.line, token.column, op))
+        node = self.parse_expr_atom()
+        if ops is not None:
+            for line, column, op in reversed(ops):
+                node = UnaryOp(line, column, op, node)
+        return node
 
     def parse_expr_atom(self) -> Expression:
         """EXPR_ATOM ::= IDENTIFIER ("[" EXPR "]")* | INTEGER | "(" EXPR ")" | FUNCTION_CALL"""
-        if self.check(TokenType.INTEGER):
-            token = self.expect(TokenType.INTEGER)
-            return IntegerLiteral(token.line, token.column, int(token.value))
-        elif self.check(TokenType.IDENTIFIER):
-            # Check if it's a function call
-            if (
-                self.pos + 1 < len(self.tokens)
-                and self.tokens[self.pos + 1].type == TokenType.LPAREN
-            ):
-                name_token = self.expect(TokenType.IDENTIFIER)
-                name = name_token.value
-                self.expect(TokenType.LPAREN)
-                args = self.parse_expr_list()
-                self.expect(TokenType.RPAREN)
-                return CallExpression(name_token.line, name_token.column, name, args)
-            else:
-                name_token = self.expect(TokenType.IDENTIFIER)
-                base = Identifier(name_token.line, name_token.column, name_token.value)
-
-                indices = []
-                while self.check(TokenType.LBRACKET):
-                    self.advance()  # consume '['
-                    index_expr = self.parse_expr()
-                    indices.append(index_expr)
-                    self.expect(TokenType.RBRACKET)  # consume ']'
-
-                if indices:
-                    return ArrayAccess(
-                        name_token.line, name_token.column, base, indices
-                    )
+        t = self._types[self.pos]
+        if t is _INTEGER:
+            token = self.tokens[self.pos]
+            self.advance()
+            return IntegerLiteral(token.line, token.column, token.value)
+        if t is _IDENTIFIER:
+            # Function call iff the next token opens a parenthesis.
+            types = self._types
+            if types[self.pos + 1] is _LPAREN:
+                name_token = self.tokens[self.pos]
+                self.pos += 2  # identifier and '('
+                # Arg-list loop inlined: every call expression runs this
+                # path, so the parse_expr_list frame is pure overhead.
+                if types[self.pos] is _RPAREN:
+                    args = _EMPTY_ARGS
                 else:
-                    return base
-        elif self.check(TokenType.LPAREN):
+                    args = [self.parse_expr()]
+                    append = args.append
+                    while types[self.pos] is _COMMA:
+                        self.pos += 1  # consume comma
+                        append(self.parse_expr())
+                if types[self.pos] is not _RPAREN:
+                    self._raise_expect(TokenType.RPAREN)
+                self.pos += 1
+                return CallExpression(
+                    name_token.line, name_token.column, name_token.value, args
+                )
+
+            name_token = self.tokens[self.pos]
+            self.advance()
+            base = Identifier(name_token.line, name_token.column, name_token.value)
+
+            indices = []
+            types = self._types
+            while types[self.pos] is _LBRACKET:
+                self.advance()  # consume '['
+                indices.append(self.parse_expr())
+                self.expect(TokenType.RBRACKET)  # consume ']'
+
+            if indices:
+                return ArrayAccess(
+                    name_token.line,
+                    name_token.column,
+                    base,
+                    indices,
+                    _literal_index_view(indices),
+                )
+            return base
+        if t is _LPAREN:
             self.advance()
             expr = self.parse_expr()
             self.expect(TokenType.RPAREN)
             return expr
-        else:
-            raise ParseError("Expected expression", self.current_token)
+        raise ParseError("Expected expression", self.current_token)
+
+
+# Statement dispatch: one dict lookup instead of a check() cascade per
+# statement.  Identifier-led statements stay special-cased in
+# parse_statement on the lexer's IdentifierKind tag.
+_STMT_DISPATCH = {
+    TokenType.IF: Parser.parse_condition,
+    TokenType.FOR: Parser.parse_loop,
+    TokenType.RETURN: Parser.parse_return,
+    TokenType.BREAK: Parser.parse_break,
+    TokenType.CONTINUE: Parser.parse_continue,
+    TokenType.LET: Parser._parse_assignment_statement,
+}
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from src.parsing.parser import (
     Program,
@@ -29,9 +31,23 @@ from src.parsing.parser import (
 
 
 class Type:
+    __slots__ = ("base_type", "dimensions", "_sig", "_str_cache", "_element_type")
+
+    # (base_type, dimensions) -> shared instance; see Type.get.
+    _intern: dict[tuple[str, tuple[int, ...]], "Type"] = {}
+
     def __init__(self, base_type: str, dimensions: list[int] | None = None):
         self.base_type = base_type
-        self.dimensions = dimensions if dimensions is not None else []
+        # Stored as a tuple: from_string caches and shares Type objects,
+        # so the dimensions must not be mutable.
+        self.dimensions = tuple(dimensions) if dimensions is not None else ()
+        # Precomputed identity tuple: __eq__ and __hash__ work on one
+        # object instead of touching both attributes per call.
+        self._sig = (base_type, self.dimensions)
+        self._str_cache: str | None = None
+        # Array types hold their interned scalar element type so index
+        # expressions resolve it with one attribute read.
+        self._element_type = Type.get(base_type) if self.dimensions else self
 
     def is_array(self) -> bool:
         return len(self.dimensions) > 0
@@ -40,78 +56,147 @@ class Type:
         return self.base_type
 
     def __str__(self) -> str:
-        if not self.is_array():
-            return self.base_type
-        dims_str = "".join(f"[{d}]" for d in self.dimensions)
-        return f"{dims_str}{self.base_type}"
+        # Types are shared and immutable, so the rendered form is built
+        # once and reused across every error message mentioning it.
+        s = self._str_cache
+        if s is None:
+            if not self.dimensions:
+                s = self.base_type
+            else:
+                dims_str = "".join(f"[{d}]" for d in self.dimensions)
+                s = f"{dims_str}{self.base_type}"
+            self._str_cache = s
+        return s
 
     def __repr__(self) -> str:
         return f"Type({self.__str__()})"
 
     def __eq__(self, other) -> bool:
-        if not isinstance(other, Type):
+        # Interned instances (Type.get / from_string) make this pointer
+        # compare the common exit.
+        if self is other:
+            return True
+        # Type is never subclassed, so the exact-type check beats
+        # isinstance on this very hot comparison.
+        if type(other) is not Type:
             return False
-        return self.base_type == other.base_type and self.dimensions == other.dimensions
+        return self._sig == other._sig
+
+    def __hash__(self) -> int:
+        return hash(self._sig)
+
+    @classmethod
+    def get(cls, base_type: str, dimensions: tuple[int, ...] = ()) -> "Type":
+        """Interned constructor: one shared instance per distinct type."""
+        key = (base_type, dimensions)
+        ty = cls._intern.get(key)
+        if ty is None:
+            ty = cls._intern[key] = cls(base_type, dimensions)
+        return ty
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def from_string(type_str: str) -> "Type":
-        """Parse a type string like '[128][64]int' or 'int' into a Type object."""
+        """Parse a type string like '[128][64]int' or 'int' into a Type object.
+
+        Results are cached: the same handful of type strings is resolved
+        for every parameter, local and return type, so repeat calls are a
+        single dict lookup and share one Type object per spelling.
+        """
+        simple = _SIMPLE.get(type_str)
+        if simple is not None:
+            return simple
         if not type_str.startswith("["):
-            return Type(type_str)
-
-        # Parse array type like "[128][64]int"
-        dimensions = []
-        pos = 0
-        while pos < len(type_str) and type_str[pos] == "[":
-            # Find the closing bracket
-            end_pos = type_str.find("]", pos)
-            if end_pos == -1:
-                raise ValueError(f"Invalid array type: {type_str}")
-            dim_str = type_str[pos + 1 : end_pos]
-            try:
-                dimensions.append(int(dim_str))
-            except ValueError:
-                raise ValueError(f"Invalid array dimension: {dim_str}")
-            pos = end_pos + 1
-
-        # The rest is the base type
-        base_type = type_str[pos:]
-        return Type(base_type, dimensions)
+            return Type.get(type_str)
+
+        # Parse array type like "[128][64]int" in one C-level regex scan
+        # instead of a find/slice/int loop per dimension.
+        m = _ARRAY_TYPE_RE.fullmatch(type_str)
+        if m is None:
+            raise ValueError(f"Invalid array type: {type_str}")
+        dimensions = tuple(int(d) for d in _DIM_RE.findall(m.group(1)))
+        return Type.get(m.group(2), dimensions)
+
+
+# "[128][64]int" -> dimension prefix and base type.
+_ARRAY_TYPE_RE = re.compile(r"((?:\[\d+\])+)(.+)")
+_DIM_RE = re.compile(r"\d+")
+
+
+# Shared instances of the two scalar types: the analyzer compares
+# against these constantly, and building a throwaway Type (plus its
+# dimensions tuple) per comparison was pure allocator churn.
+INT_TY = Type.get("int")
+VOID_TY = Type.get("void")
+
+# from_string short-circuits to these for the overwhelmingly common case.
+_SIMPLE = {"int": INT_TY, "void": VOID_TY}
+
+
+def _element_type(array_type: "Type") -> "Type":
+    """Scalar element type of an array, shared via the intern table so
+    the analyzer's identity comparisons hold for indexed accesses too."""
+    return array_type._element_type
 
 
 class SemanticError(Exception):
     def __init__(self, message: str, line: int = 0, column: int = 0):
+        super().__init__(message, line, column)
         self.message = message
         self.line = line
         self.column = column
-        super().__init__(f"{message} at line {line}, column {column}")
+
+    def __str__(self) -> str:
+        # Deferred so collecting an error never pays for the f-string;
+        # it only runs when the error is rendered.
+        return f"{self.message} at line {self.line}, column {self.column}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     name: str
     return_type: "Type"
-    params: list[tuple[str, "Type"]]
+    # Parallel lists instead of a list of (name, type) pairs: the call
+    # checker only reads types and the declare loop only pairs them up
+    # once, so neither path builds or unpacks tuples.
+    param_names: list[str]
+    param_types: list["Type"]
     line: int
     column: int
 
     def __repr__(self):
-        param_str = ", ".join(f"{name} {type}" for name, type in self.params)
+        param_str = ", ".join(
+            f"{name} {type}" for name, type in zip(self.param_names, self.param_types)
+        )
         return f"FunctionInfo({self.name}({param_str}) -> {self.return_type})"
 
 
 class SymbolTable:
+    __slots__ = ("parent", "variables", "functions", "_root_functions", "_resolved")
+
     def __init__(self, parent: Optional["SymbolTable"] = None):
         self.parent = parent
-        self.variables: dict[str, Type] = {}
-        self.functions: dict[str, FunctionInfo] = {}
+        # Allocated on first declaration: many block scopes are pure
+        # control flow and never declare anything.
+        self.variables: dict[str, Type] | None = None
+        # Per-scope cache of names resolved from an ancestor, so sibling
+        # lookups of the same outer variable skip the chain walk.
+        # Allocated on first ancestor hit.
+        self._resolved: dict[str, Type] | None = None
+        self.functions: dict[str, FunctionInfo] | None = {} if parent is None else None
+        # Functions only ever live in the global scope; a direct
+        # reference to that dict makes lookup_function one .get no
+        # matter how deeply the scope is nested.
+        self._root_functions = (
+            self.functions if parent is None else parent._root_functions
+        )
 
     def __str__(self):
         variables_str = ", ".join(
-            f"{name}: {type_}" for name, type_ in self.variables.items()
+            f"{name}: {type_}" for name, type_ in (self.variables or {}).items()
         )
         functions_str = ", ".join(
-            f"{name}: {info}" for name, info in self.functions.items()
+            f"{name}: {info}" for name, info in (self.functions or {}).items()
         )
         return f"SymbolTable:\n\tVariables: {{{variables_str}}}\n\tFunctions: {{{functions_str}}}"
 
@@ -120,39 +205,70 @@ class SymbolTable:
             f"SymbolTable(variables={self.variables!r}, functions={self.functions!r})"
         )
 
-    def declare_variable(self, name: str, var_type: Type, line: int, column: int):
-        if name in self.variables:
-            raise SemanticError(
+    def declare_variable(
+        self, name: str, var_type: Type, line: int, column: int
+    ) -> SemanticError | None:
+        """Declare a variable, returning the error on a collision.
+
+        Collisions are ordinary user mistakes, so they come back as a
+        value instead of an exception the caller would immediately catch
+        and append.
+        """
+        variables = self.variables
+        if variables is None:
+            variables = self.variables = {}
+        elif name in variables:
+            return SemanticError(
                 f"Variable '{name}' already declared in this scope", line, column
             )
-        self.variables[name] = var_type
+        variables[name] = var_type
+        # The declaration shadows whatever an earlier lookup resolved.
+        if self._resolved is not None:
+            self._resolved.pop(name, None)
+        return None
 
     def lookup_variable(self, name: str) -> Type | None:
-        if name in self.variables:
-            return self.variables[name]
-        if self.parent:
-            return self.parent.lookup_variable(name)
+        resolved = self._resolved
+        if resolved is not None:
+            var_type = resolved.get(name)
+            if var_type is not None:
+                return var_type
+        # Iterative walk: one frame per lookup instead of one per scope.
+        table = self
+        while table is not None:
+            variables = table.variables
+            if variables is not None:
+                var_type = variables.get(name)
+                if var_type is not None:
+                    if table is not self:
+                        # Ancestor hit: remember it here so the next
+                        # lookup of this name stops immediately.
+                        if resolved is None:
+                            resolved = self._resolved = {}
+                        resolved[name] = var_type
+                    return var_type
+            table = table.parent
         return None
 
-    def declare_function(self, func_info: FunctionInfo):
-        if func_info.name in self.functions:
-            raise SemanticError(
+    def declare_function(self, func_info: FunctionInfo) -> SemanticError | None:
+        functions = self.functions
+        if functions is None:
+            functions = self.functions = {}
+        elif func_info.name in functions:
+            return SemanticError(
                 f"Function '{func_info.name}' already declared",
                 func_info.line,
                 func_info.column,
             )
-        self.functions[func_info.name] = func_info
+        functions[func_info.name] = func_info
+        return None
 
     def lookup_function(self, name: str) -> FunctionInfo | None:
-        if name in self.functions:
-            return self.functions[name]
-        if self.parent:
-            return self.parent.lookup_function(name)
-        return None
+        return self._root_functions.get(name)
 
 
 class SemanticAnalyzer:
-    def __init__(self, program: Program):
+    def __init__(self, program: Program, error_cap: int = 10**6):
         self.program = program
         self.global_scope = SymbolTable()
         self.current_scope: SymbolTable = self.global_scope
@@ -162,56 +278,79 @@ class SemanticAnalyzer:
         self.loop_depth: int = 0
 
         self.errors: list[SemanticError] = []
+        # Stop recording errors past this many: callers that only show
+        # the first handful (e.g. an editor) avoid unbounded growth on
+        # pathological inputs.  The default never triggers.
+        self.error_cap = error_cap
+
+        # Expression node -> resolved type, keyed by id() since AST nodes
+        # are unhashable.  A node always resolves against the same scope,
+        # so within one function each subtree is analyzed at most once
+        # even when a caller (e.g. _check_function_call) revisits it.
+        self._expr_type_cache: dict[int, Type] = {}
+
+    def _emit(self, message: str, line: int, column: int) -> None:
+        """Record a semantic error unless the cap has been reached."""
+        if len(self.errors) < self.error_cap:
+            self.errors.append(SemanticError(message, line, column))
+
+    def _record(self, err: SemanticError) -> None:
+        """Like _emit, for errors that are already built (declare_*)."""
+        if len(self.errors) < self.error_cap:
+            self.errors.append(err)
 
     def analyze(self) -> list[SemanticError]:
         self.errors = []
         self.program.symbol_table = self.global_scope
 
-        for func in self.program.functions:
-            self._collect_function(func)
-
-        for func in self.program.functions:
-            self._analyze_function(func)
+        # Collect all signatures first (comprehension keeps the loop at
+        # the C level), then declare them so forward references resolve.
+        functions = self.program.functions
+        infos = [self._make_func_info(func) for func in functions]
+        declare = self.global_scope.declare_function
+        for info in infos:
+            err = declare(info)
+            if err is not None:
+                self._record(err)
+
+        # Hand each function its own FunctionInfo directly: no lookup,
+        # and a duplicate definition is analyzed against its own
+        # signature rather than the first declaration's.
+        for func, info in zip(functions, infos):
+            self._analyze_function(func, info)
 
         return self.errors
 
-    def _collect_function(self, func: Function):
-        param_types = [(arg.name, Type.from_string(arg.type)) for arg in func.args]
+    def _make_func_info(self, func: Function) -> FunctionInfo:
+        param_names = [arg.name for arg in func.args]
+        param_types = [Type.from_string(arg.type) for arg in func.args]
         return_type = Type.from_string(func.return_type)
 
         if return_type.is_array():
             msg = "Functions cannot return arrays"
-            self.errors.append(SemanticError(msg, func.line, func.column))
+            self._emit(msg, func.line, func.column)
 
-        func_info = FunctionInfo(
-            func.name, return_type, param_types, func.line, func.column
+        return FunctionInfo(
+            func.name, return_type, param_names, param_types, func.line, func.column
         )
 
-        try:
-            self.global_scope.declare_function(func_info)
-        except SemanticError as e:
-            self.errors.append(e)
-
-    def _analyze_function(self, func: Function):
+    def _analyze_function(self, func: Function, func_info: FunctionInfo):
+        # All node ids in the cache belong to the previous function;
+        # dropping them keeps the table small.
+        self._expr_type_cache.clear()
         func.body.symbol_table = SymbolTable(parent=self.global_scope)
         self.current_scope = func.body.symbol_table
 
-        func_info = self.global_scope.lookup_function(func.name)
-        if not func_info:
-            msg = f"Function '{func.name}' not found in symbol table"
-            self.errors.append(SemanticError(msg, func.line, func.column))
-            return
-
         self.current_function = func_info
 
-        for arg in func.args:
-            try:
-                arg_type = Type.from_string(arg.type)
-                self.current_scope.declare_variable(
-                    arg.name, arg_type, func.line, func.column
-                )
-            except SemanticError as e:
-                self.errors.append(e)
+        # The collect pass already parsed the parameter types; reuse them
+        # instead of running Type.from_string a second time per argument.
+        for param_name, param_type in zip(func_info.param_names, func_info.param_types):
+            err = self.current_scope.declare_variable(
+                param_name, param_type, func.line, func.column
+            )
+            if err is not None:
+                self._record(err)
 
         for statement in func.body.statements:
             self._analyze_statement(statement)
@@ -220,40 +359,26 @@ class SemanticAnalyzer:
         self.current_function = None
 
     def _analyze_statement(self, stmt: Statement):
-        match stmt:
-            case Assignment():
-                self._analyze_assignment(stmt)
-            case Reassignment():
-                self._analyze_reassignment(stmt)
-            case Condition():
-                self._analyze_condition(stmt)
-            case ForLoop():
-                self._analyze_for_loop(stmt)
-            case UnconditionalLoop():
-                self._analyze_unconditional_loop(stmt)
-            case FunctionCall():
-                self._analyze_function_call_stmt(stmt)
-            case Return():
-                self._analyze_return(stmt)
-            case Break():
-                self._analyze_break(stmt)
-            case Continue():
-                self._analyze_continue(stmt)
-            case _:
-                msg = f"Unknown statement type: {type(stmt).__name__}"
-                self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+        # Dispatch on the node class directly: one dict lookup instead of
+        # the linear isinstance cascade a match statement compiles to.
+        handler = _STMT_HANDLERS.get(type(stmt))
+        if handler is None:
+            msg = f"Unknown statement type: {type(stmt).__name__}"
+            self._emit(msg, stmt.line, stmt.column)
+            return
+        handler(self, stmt)
 
     def _analyze_assignment(self, stmt: Assignment):
         if self.current_scope.lookup_variable(stmt.name) is not None:
             msg = f"Variable '{stmt.name}' already declared in this scope"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
             return
 
         var_type = Type.from_string(stmt.type)
         if isinstance(stmt.value, ArrayInit):
             if not var_type.is_array():
                 msg = f"Cannot initialize non-array variable '{stmt.name}' of type {var_type} with array syntax"
-                self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+                self._emit(msg, stmt.line, stmt.column)
 
             self.current_scope.declare_variable(
                 stmt.name, var_type, stmt.line, stmt.column
@@ -263,7 +388,7 @@ class SemanticAnalyzer:
         value_type = self._analyze_expression(stmt.value)
         if var_type.is_array() and value_type.is_array():
             msg = f"Cannot assign array to array: cannot assign {value_type} to variable '{stmt.name}' of type {var_type}"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
             self.current_scope.declare_variable(
                 stmt.name, var_type, stmt.line, stmt.column
             )
@@ -271,7 +396,7 @@ class SemanticAnalyzer:
 
         if value_type != var_type:
             msg = f"Type mismatch: cannot assign {value_type} to variable '{stmt.name}' of type {var_type}"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
 
         self.current_scope.declare_variable(stmt.name, var_type, stmt.line, stmt.column)
 
@@ -284,58 +409,66 @@ class SemanticAnalyzer:
         # Forbid array-to-array assignment (but allow array element assignment)
         if target_type.is_array() and value_type.is_array():
             msg = f"Cannot assign array to array: cannot assign {value_type} to array of type {target_type}"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
             return
 
         if value_type != target_type:
             msg = f"Type mismatch: cannot assign {value_type} to target of type {target_type}"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
 
     def _analyze_lvalue(self, lvalue: LValue) -> Type | None:
-        match lvalue:
-            case LValueIdentifier():
-                var_type = self.current_scope.lookup_variable(lvalue.name)
-                if var_type is None:
-                    msg = f"Variable '{lvalue.name}' is not declared"
-                    self.errors.append(SemanticError(msg, lvalue.line, lvalue.column))
-                    return None
-                return var_type
-            case LValueArrayAccess():
-                base_type = self.current_scope.lookup_variable(lvalue.base)
-                if base_type is None:
-                    msg = f"Variable '{lvalue.base}' is not declared"
-                    self.errors.append(SemanticError(msg, lvalue.line, lvalue.column))
-                    return None
-
-                if not base_type.is_array():
-                    msg = f"Array access on non-array variable '{lvalue.base}'"
-                    self.errors.append(SemanticError(msg, lvalue.line, lvalue.column))
-                    return None
-
-                if len(lvalue.indices) != len(base_type.dimensions):
-                    msg = f"Array access has {len(lvalue.indices)} indices but array has {len(base_type.dimensions)} dimensions"
-                    self.errors.append(SemanticError(msg, lvalue.line, lvalue.column))
-                    return Type(base_type.base_type)  # error recovery
-
-                # Check that each index is int
-                for idx in lvalue.indices:
-                    idx_type = self._analyze_expression(idx)
-                    if idx_type == Type("int"):
-                        continue
-                    msg = f"Array index must be int, got {idx_type}"
-                    self.errors.append(SemanticError(msg, lvalue.line, lvalue.column))
-
-                return Type(base_type.base_type)
-            case _:
-                msg = f"Unknown lvalue type: {type(lvalue).__name__}"
-                self.errors.append(SemanticError(msg, lvalue.line, lvalue.column))
+        # Exact-type tests instead of match: the lvalue classes are never
+        # subclassed, and class patterns pay for a subclass check plus
+        # __match_args__ handling even without subpatterns.
+        lvalue_class = type(lvalue)
+        if lvalue_class is LValueIdentifier:
+            var_type = self.current_scope.lookup_variable(lvalue.name)
+            if var_type is None:
+                msg = f"Variable '{lvalue.name}' is not declared"
+                self._emit(msg, lvalue.line, lvalue.column)
+                return None
+            return var_type
+
+        if lvalue_class is LValueArrayAccess:
+            base_type = self.current_scope.lookup_variable(lvalue.base)
+            if base_type is None:
+                msg = f"Variable '{lvalue.base}' is not declared"
+                self._emit(msg, lvalue.line, lvalue.column)
+                return None
+
+            if not base_type.is_array():
+                msg = f"Array access on non-array variable '{lvalue.base}'"
+                self._emit(msg, lvalue.line, lvalue.column)
                 return None
 
+            n_idx = len(lvalue.indices)
+            n_dim = len(base_type.dimensions)
+            if n_idx != n_dim:
+                msg = f"Array access has {n_idx} indices but array has {n_dim} dimensions"
+                self._emit(msg, lvalue.line, lvalue.column)
+                return _element_type(base_type)  # error recovery
+
+            # Check that each index is int
+            analyze = self._analyze_expression
+            err = self._emit
+            for idx in lvalue.indices:
+                idx_type = analyze(idx)
+                if idx_type is INT_TY:
+                    continue
+                msg = f"Array index must be int, got {idx_type}"
+                err(msg, lvalue.line, lvalue.column)
+
+            return _element_type(base_type)
+
+        msg = f"Unknown lvalue type: {lvalue_class.__name__}"
+        self._emit(msg, lvalue.line, lvalue.column)
+        return None
+
     def _analyze_condition(self, stmt: Condition):
         cond_type = self._analyze_expression(stmt.condition)
-        if cond_type != Type("int"):
+        if cond_type is not INT_TY:
             msg = f"Condition expression must be int, got {cond_type}"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
 
         old_scope = self.current_scope
         stmt.then_block.symbol_table = SymbolTable(parent=old_scope)
@@ -362,9 +495,9 @@ class SemanticAnalyzer:
             self._analyze_assignment(assignment)
 
         cond_type = self._analyze_expression(stmt.condition)
-        if cond_type != Type("int"):
+        if cond_type is not INT_TY:
             msg = f"Loop condition must be int, got {cond_type}"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
 
         for reassignment in stmt.update:
             self._analyze_reassignment(reassignment)
@@ -390,34 +523,34 @@ class SemanticAnalyzer:
     def _analyze_return(self, stmt: Return):
         if not self.current_function:
             msg = "Return statement outside of function"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
             return
 
         if stmt.value is None:
-            if self.current_function.return_type != Type("void"):
+            if self.current_function.return_type is not VOID_TY:
                 msg = f"Function '{self.current_function.name}' expects return type {self.current_function.return_type}, but got void"
-                self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+                self._emit(msg, stmt.line, stmt.column)
             return
 
-        if self.current_function.return_type == Type("void"):
+        if self.current_function.return_type is VOID_TY:
             msg = f"Function '{self.current_function.name}' returns void, but return statement has a value"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
             return
 
         value_type = self._analyze_expression(stmt.value)
         if value_type != self.current_function.return_type:
             msg = f"Return type mismatch: function '{self.current_function.name}' returns {self.current_function.return_type}, but got {value_type}"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
 
     def _analyze_break(self, stmt: Break):
         if self.loop_depth == 0:
             msg = "Break statement outside of loop"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
 
     def _analyze_continue(self, stmt: Continue):
         if self.loop_depth == 0:
             msg = "Continue statement outside of loop"
-            self.errors.append(SemanticError(msg, stmt.line, stmt.column))
+            self._emit(msg, stmt.line, stmt.column)
 
     def _analyze_block(self, stmt: Block):
         old_scope = self.current_scope
@@ -430,78 +563,101 @@ class SemanticAnalyzer:
         self.current_scope = old_scope
 
     def _analyze_expression(self, expr: Expression) -> Type:
-        match expr:
-            case IntegerLiteral():
-                return Type("int")
-            case Identifier():
-                var_type = self.current_scope.lookup_variable(expr.name)
-                if var_type is not None:
-                    return var_type
-                line = self.current_function.line if self.current_function else 0
-                column = self.current_function.column if self.current_function else 0
-                msg = f"Variable '{expr.name}' is not declared"
-                self.errors.append(SemanticError(msg, line, column))
-                return Type("int")  # Default to int for error recovery
-            case ArrayAccess():
-                return self._analyze_array_access(expr)
-            case ArrayInit():
-                # ArrayInit should only appear in assignments, and type is determined there
-                # Return a placeholder - this shouldn't be reached in normal flow
-                return Type("int")
-            case BinaryOp():
-                return self._analyze_binary_op(expr)
-            case UnaryOp():
-                return self._analyze_unary_op(expr)
-            case CallExpression():
-                return self._analyze_call_expression(expr)
-            case _:
-                msg = f"Unknown expression type: {type(expr).__name__}"
-                self.errors.append(SemanticError(msg, 0, 0))
-                return Type("int")  # Default to int for error recovery
+        # Integer literals and identifiers dominate real expression
+        # trees; settle them before touching the memo or dispatch table.
+        node_class = type(expr)
+        if node_class is IntegerLiteral:
+            return INT_TY
+        if node_class is Identifier:
+            var_type = self.current_scope.lookup_variable(expr.name)
+            if var_type is not None:
+                return var_type
+            return self._analyze_identifier(expr)
+        key = id(expr)
+        cache = self._expr_type_cache
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        handler = _EXPR_HANDLERS.get(node_class)
+        if handler is None:
+            msg = f"Unknown expression type: {type(expr).__name__}"
+            self._emit(msg, 0, 0)
+            return INT_TY  # Default to int for error recovery
+        result = handler(self, expr)
+        cache[key] = result
+        return result
+
+    def _analyze_integer_literal(self, expr: IntegerLiteral) -> Type:
+        return INT_TY
+
+    def _analyze_identifier(self, expr: Identifier) -> Type:
+        var_type = self.current_scope.lookup_variable(expr.name)
+        if var_type is not None:
+            return var_type
+        line = self.current_function.line if self.current_function else 0
+        column = self.current_function.column if self.current_function else 0
+        msg = f"Variable '{expr.name}' is not declared"
+        self._emit(msg, line, column)
+        return INT_TY  # Default to int for error recovery
+
+    def _analyze_array_init(self, expr: ArrayInit) -> Type:
+        # ArrayInit should only appear in assignments, and type is determined there
+        # Return a placeholder - this shouldn't be reached in normal flow
+        return INT_TY
 
     def _analyze_array_access(self, expr: ArrayAccess) -> Type:
         base_type = self._analyze_expression(expr.base)
         if not base_type.is_array():
             msg = f"Array access on non-array type {base_type}"
-            self.errors.append(SemanticError(msg, expr.line, expr.column))
-            return Type("int")  # Error recovery
-
-        if len(expr.indices) != len(base_type.dimensions):
-            msg = f"Array access has {len(expr.indices)} indices but array has {len(base_type.dimensions)} dimensions"
-            self.errors.append(SemanticError(msg, expr.line, expr.column))
-            return Type(base_type.base_type)  # Return base type for error recovery
-
+            self._emit(msg, expr.line, expr.column)
+            return INT_TY  # Error recovery
+
+        n_idx = len(expr.indices)
+        n_dim = len(base_type.dimensions)
+        if n_idx != n_dim:
+            msg = f"Array access has {n_idx} indices but array has {n_dim} dimensions"
+            self._emit(msg, expr.line, expr.column)
+            return _element_type(base_type)  # Return base type for error recovery
+
+        analyze = self._analyze_expression
+        err = self._emit
         for idx in expr.indices:
-            idx_type = self._analyze_expression(idx)
-            if idx_type != Type("int"):
+            idx_type = analyze(idx)
+            if idx_type is not INT_TY:
                 msg = f"Array index must be int, got {idx_type}"
-                self.errors.append(SemanticError(msg, expr.line, expr.column))
+                err(msg, expr.line, expr.column)
 
         # Return the base element type
-        return Type(base_type.base_type)
+        return _element_type(base_type)
 
     def _analyze_binary_op(self, expr: BinaryOp) -> Type:
         left_type = self._analyze_expression(expr.left)
-        right_type = self._analyze_expression(expr.right)
 
-        if left_type != Type("int"):
+        if left_type is not INT_TY:
             msg = f"Left operand of '{expr.operator}' must be int, got {left_type}"
-            self.errors.append(SemanticError(msg, expr.line, expr.column))
+            self._emit(msg, expr.line, expr.column)
+            # Once the cap is hit nothing we find in the right subtree
+            # can be reported, so skip walking it entirely.  With the
+            # default (effectively unlimited) cap this never triggers and
+            # error reporting is unchanged.
+            if len(self.errors) >= self.error_cap:
+                return INT_TY
 
-        if right_type != Type("int"):
+        right_type = self._analyze_expression(expr.right)
+        if right_type is not INT_TY:
             msg = f"Right operand of '{expr.operator}' must be int, got {right_type}"
-            self.errors.append(SemanticError(msg, expr.line, expr.column))
+            self._emit(msg, expr.line, expr.column)
 
-        return Type("int")
+        return INT_TY
 
     def _analyze_unary_op(self, expr: UnaryOp) -> Type:
         operand_type = self._analyze_expression(expr.operand)
 
-        if operand_type != Type("int"):
+        if operand_type is not INT_TY:
             msg = f"Operand of '{expr.operator}' must be int, got {operand_type}"
-            self.errors.append(SemanticError(msg, expr.line, expr.column))
+            self._emit(msg, expr.line, expr.column)
 
-        return Type("int")
+        return INT_TY
 
     def _analyze_call_expression(self, expr: CallExpression) -> Type:
         line = self.current_function.line if self.current_function else 0
@@ -509,7 +665,7 @@ class SemanticAnalyzer:
         func_info = self._check_function_call(expr.name, expr.args, line, column)
         if func_info:
             return func_info.return_type
-        return Type("int")  # Default for error recovery
+        return INT_TY  # Default for error recovery
 
     def _check_function_call(
         self, name: str, args: list[Expression], line: int, column: int
@@ -518,39 +674,65 @@ class SemanticAnalyzer:
         func_info = self.current_scope.lookup_function(name)
         if func_info is None:
             msg = f"Function '{name}' is not declared"
-            self.errors.append(SemanticError(msg, line, column))
+            self._emit(msg, line, column)
             return None
 
-        if len(args) != len(func_info.params):
-            msg = f"Function '{name}' expects {len(func_info.params)} arguments, but got {len(args)}"
-            self.errors.append(SemanticError(msg, line, column))
+        if len(args) != len(func_info.param_types):
+            msg = f"Function '{name}' expects {len(func_info.param_types)} arguments, but got {len(args)}"
+            self._emit(msg, line, column)
             return func_info
 
-        for i, (arg_expr, (param_name, param_type)) in enumerate(
-            zip(args, func_info.params)
-        ):
-            arg_type = self._analyze_expression(arg_expr)
+        # One fused pass: type-check each argument and track array
+        # variables for the duplicate-argument rule in the same walk.
+        array_vars_seen: set[str] = set()
+        analyze = self._analyze_expression
+        err = self._emit
+        param_types = func_info.param_types
+        # Indexed iteration: no zip-pair or unpacking tuples per argument.
+        for i in range(len(args)):
+            arg_expr = args[i]
+            param_type = param_types[i]
+            arg_type = analyze(arg_expr)
             if arg_type != param_type:
                 msg = f"Argument {i + 1} of function '{name}' expects type {param_type}, but got {arg_type}"
-                self.errors.append(SemanticError(msg, line, column))
+                err(msg, line, column)
 
-        array_vars_seen: dict[str, int] = {}  # variable name -> argument index
-        for i, (arg_expr, (param_name, param_type)) in enumerate(
-            zip(args, func_info.params)
-        ):
-            if isinstance(arg_expr, Identifier):
+            if type(arg_expr) is Identifier and arg_type.is_array():
                 var_name = arg_expr.name
-                arg_type = self._analyze_expression(arg_expr)
-                if arg_type.is_array():
-                    if var_name in array_vars_seen:
-                        msg = f"Cannot pass the same array variable '{var_name}' as multiple arguments to function '{name}'"
-                        self.errors.append(SemanticError(msg, line, column))
-                    else:
-                        array_vars_seen[var_name] = i
+                if var_name in array_vars_seen:
+                    msg = f"Cannot pass the same array variable '{var_name}' as multiple arguments to function '{name}'"
+                    err(msg, line, column)
+                else:
+                    array_vars_seen.add(var_name)
 
         return func_info
 
 
+# Node-class -> unbound handler, looked up by _analyze_statement and
+# _analyze_expression.  Built after the class so the methods exist.
+_STMT_HANDLERS = {
+    Assignment: SemanticAnalyzer._analyze_assignment,
+    Reassignment: SemanticAnalyzer._analyze_reassignment,
+    Condition: SemanticAnalyzer._analyze_condition,
+    ForLoop: SemanticAnalyzer._analyze_for_loop,
+    UnconditionalLoop: SemanticAnalyzer._analyze_unconditional_loop,
+    FunctionCall: SemanticAnalyzer._analyze_function_call_stmt,
+    Return: SemanticAnalyzer._analyze_return,
+    Break: SemanticAnalyzer._analyze_break,
+    Continue: SemanticAnalyzer._analyze_continue,
+}
+
+_EXPR_HANDLERS = {
+    IntegerLiteral: SemanticAnalyzer._analyze_integer_literal,
+    Identifier: SemanticAnalyzer._analyze_identifier,
+    ArrayAccess: SemanticAnalyzer._analyze_array_access,
+    ArrayInit: SemanticAnalyzer._analyze_array_init,
+    BinaryOp: SemanticAnalyzer._analyze_binary_op,
+    UnaryOp: SemanticAnalyzer._analyze_unary_op,
+    CallExpression: SemanticAnalyzer._analyze_call_expression,
+}
+
+
 if __name__ == "__main__":
     from .lexer import Lexer
     from .parser import Parser
@@ -454,6 +454,14 @@ func bar() -> int { return 1; }"""
         self.assertIsInstance(expr.right, BinaryOp)
         self.assertEqual(expr.right.operator, "-")
 
+    def test_memoized_expression_parsing(self):
+        """Test that the opt-in expression memo produces the same AST."""
+        source = "func main() -> void { let a int = (1 + 2) * (3 - 4) && x < y; }"
+        lexer = Lexer(source)
+        plain = Parser(Lexer(source)).parse()
+        memoized = Parser(lexer, memoize_expressions=True).parse()
+        self.assertEqual(plain, memoized)
+
     def test_nested_statements(self):
         """Test parsing nested statements."""
         source = """func main() -> void {